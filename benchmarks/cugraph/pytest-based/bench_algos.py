@@ -1,4 +1,4 @@
-# Copyright (c) 2020-2025, NVIDIA CORPORATION.
+# Copyright (c) 2020-2026, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -11,10 +11,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import os
+import shutil
+import tempfile
+import warnings
+
 import pytest
 import numpy as np
+import cupy
 
 import rmm
+from rmm.allocators.cupy import rmm_cupy_allocator
+import cudf
 import dask_cudf
 from pylibcugraph.testing import gen_fixture_params_product
 
@@ -32,6 +41,11 @@ from cugraph_benchmarking.params import (
 )
 
 
+# Bump this whenever the way RMAT edgelists (including their weights) are
+# generated changes, so stale cached edgelists are not reused.
+_RMAT_CACHE_VERSION = 1
+
+
 # duck-type compatible Dataset for RMAT data
 class RmatDataset:
     def __init__(self, scale=4, edgefactor=2, mg=False):
@@ -45,9 +59,49 @@ class RmatDataset:
         mg_str = "mg" if self.mg else "sg"
         return f"rmat_{mg_str}_{self._scale}_{self._edgefactor}"
 
+    def _get_cache_path(self, seed):
+        """
+        Return the path of the cached edgelist, or None if caching is disabled.
+        """
+        if not _rmat_cache_dir:
+            return None
+        return os.path.join(
+            _rmat_cache_dir,
+            f"rmat_v{_RMAT_CACHE_VERSION}_{self._scale}_{self._edgefactor}_"
+            f"{self.mg}_{seed}.parquet",
+        )
+
+    def _write_cache(self, cache_path):
+        """
+        Write the edgelist to cache_path. Caching is best-effort: any failure
+        only results in a warning, and the edgelist is written to a temporary
+        location first so an interrupted write never leaves a partial file (or
+        MG directory) at cache_path.
+        """
+        tmp_dir = None
+        try:
+            os.makedirs(_rmat_cache_dir, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(dir=_rmat_cache_dir)
+            tmp_path = os.path.join(tmp_dir, os.path.basename(cache_path))
+            self._edgelist.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            warnings.warn(f"Could not cache RMAT edgelist to {cache_path}: {e}")
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
     def get_edgelist(self, fetch=False):
         seed = 42
         if self._edgelist is None:
+            # Generating a large RMAT graph is expensive, so reuse the result
+            # of a previous run if one was written to the cache.
+            cache_path = self._get_cache_path(seed)
+            if cache_path is not None and os.path.exists(cache_path):
+                read_parquet = dask_cudf.read_parquet if self.mg else cudf.read_parquet
+                self._edgelist = read_parquet(cache_path)
+                return self._edgelist
+
             self._edgelist = rmat(
                 self._scale,
                 (2**self._scale) * self._edgefactor,
@@ -60,13 +114,30 @@ class RmatDataset:
                 create_using=None,  # return edgelist instead of Graph instance
                 mg=self.mg,
             )
-            rng = np.random.default_rng(seed)
             if self.mg:
+                # Generate the weights on device, seeding each partition
+                # separately so partitions do not share a random stream.
+                def gen_weights(df, partition_info=None):
+                    rng = cupy.random.default_rng(seed + partition_info["number"])
+                    return cudf.Series(
+                        rng.random(size=len(df), dtype="float32"), index=df.index
+                    )
+
                 self._edgelist["weight"] = self._edgelist.map_partitions(
-                    lambda df: rng.random(size=len(df))
+                    gen_weights, meta=("weight", "float32")
                 )
             else:
-                self._edgelist["weight"] = rng.random(size=len(self._edgelist))
+                rng = np.random.default_rng(seed)
+                self._edgelist["weight"] = rng.random(
+                    size=len(self._edgelist), dtype=np.float32
+                )
+
+            if cache_path is not None:
+                if self.mg:
+                    # Compute the edgelist once so writing the cache and
+                    # building the graph do not each regenerate it.
+                    self._edgelist = self._edgelist.persist()
+                self._write_cache(cache_path)
 
         return self._edgelist
 
@@ -117,6 +188,9 @@ class RmatDataset:
 
 _rmat_scale = getattr(pytest, "_rmat_scale", 20)  # ~1M vertices
 _rmat_edgefactor = getattr(pytest, "_rmat_edgefactor", 16)  # ~17M edges
+_rmat_cache_dir = getattr(
+    pytest, "_rmat_cache_dir", os.path.expanduser("~/.cache/cugraph_bench")
+)
 rmat_sg_dataset = pytest.param(
     RmatDataset(scale=_rmat_scale, edgefactor=_rmat_edgefactor, mg=False),
     marks=[
@@ -146,25 +220,52 @@ dataset_fixture_params = gen_fixture_params_product(
 # (see conftest.py for details).
 # The defaults for managed_mem (False) and pool_alloc (True) are set in
 # conftest.py
-RMM_SETTINGS = {"managed_mem": False, "pool_alloc": False}
+RMM_SETTINGS = {"managed_mem": False, "pool_alloc": False, "mg": False}
+
+# Fraction of the free device memory used for the initial RMM pool in SG runs
+# when the pool allocator is enabled. CuPy is routed through RMM when the pool
+# is sized this way, so the remainder is only a reserve for allocations made
+# outside of RMM (CUDA context, cuBLAS/cuSPARSE workspaces, etc.).
+RMM_POOL_FRACTION = 0.9
 
 # FIXME: this only changes the RMM config in a SG environment. The dask config
 # that applies to RMM in an MG environment is not changed by this!
-def reinitRMM(managed_mem, pool_alloc):
+def reinitRMM(managed_mem, pool_alloc, mg=False):
     """
     Reinitializes RMM to the value of managed_mem and pool_alloc, but only if
-    those values are different that the current configuration.
+    those values (or whether an MG dataset is being used) are different than
+    the current configuration.
     """
-    if (managed_mem != RMM_SETTINGS["managed_mem"]) or (
-        pool_alloc != RMM_SETTINGS["pool_alloc"]
+    if (
+        (managed_mem != RMM_SETTINGS["managed_mem"])
+        or (pool_alloc != RMM_SETTINGS["pool_alloc"])
+        or (mg != RMM_SETTINGS["mg"])
     ):
+        # Release the previous memory resource (and any pool it holds) before
+        # the new one is created, so the two are never resident at the same
+        # time and the free memory measured below includes the old pool.
+        rmm.mr.set_current_device_resource(rmm.mr.CudaMemoryResource())
+        gc.collect()
+
+        initial_pool_size = 2 << 27
+        # For SG, size the initial pool from the free device memory so it
+        # does not need to grow while a benchmark is running. The pool can
+        # still grow past this if needed. MG keeps a small pool since the
+        # Dask worker on this GPU needs the memory instead.
+        if pool_alloc and not mg:
+            free_mem, _ = rmm.mr.available_device_memory()
+            initial_pool_size = int(free_mem * RMM_POOL_FRACTION) // 256 * 256
+            # Results returned by pylibcugraph and temporaries in the cugraph
+            # Python layer are allocated with CuPy, so have those use the pool
+            # rather than the small remainder outside of it.
+            cupy.cuda.set_allocator(rmm_cupy_allocator)
 
         rmm.reinitialize(
             managed_memory=managed_mem,
             pool_allocator=pool_alloc,
-            initial_pool_size=2 << 27,
+            initial_pool_size=initial_pool_size,
         )
-        RMM_SETTINGS.update(managed_mem=managed_mem, pool_alloc=pool_alloc)
+        RMM_SETTINGS.update(managed_mem=managed_mem, pool_alloc=pool_alloc, mg=mg)
 
 
 ###############################################################################
@@ -180,29 +281,45 @@ def reinitRMM(managed_mem, pool_alloc):
 
 @pytest.fixture(scope="module", params=rmm_fixture_params)
 def rmm_config(request):
-    reinitRMM(request.param[0], request.param[1])
+    return (request.param[0], request.param[1])
+
+
+@pytest.fixture(scope="session")
+def dask_client():
+    """
+    Fixture which sets up a Dask cluster and client shared by all MG
+    datasets for the session, and tears them down when the session ends.
+    """
+    (client, cluster) = mg_utils.start_dask_client()
+
+    yield (client, cluster)
+
+    mg_utils.stop_dask_client(client, cluster)
 
 
 @pytest.fixture(scope="module", params=dataset_fixture_params)
 def dataset(request, rmm_config):
 
     """
-    Fixture which provides a Dataset instance, setting up a Dask cluster and
-    client if necessary for MG, to tests and other fixtures. When all
-    tests/fixtures are done with the Dataset, it has the Dask cluster and
-    client torn down (if MG) and all data loaded is freed.
+    Fixture which provides a Dataset instance, ensuring the session's Dask
+    cluster and client are running if necessary for MG, to tests and other
+    fixtures. When all tests/fixtures are done with the Dataset, all data
+    loaded is freed.
     """
     dataset = request.param[0]
-    client = cluster = None
     # For now, only RmatDataset instanaces support MG and have a "mg" attr.
-    if hasattr(dataset, "mg") and dataset.mg:
-        (client, cluster) = mg_utils.start_dask_client()
+    mg = hasattr(dataset, "mg") and dataset.mg
+    # RMM is configured here rather than in rmm_config since the pool size
+    # depends on whether the dataset is MG.
+    reinitRMM(*rmm_config, mg=mg)
+    # The Dask client is requested lazily so SG-only runs never start a
+    # cluster.
+    if mg:
+        request.getfixturevalue("dask_client")
 
     yield dataset
 
     dataset.unload()
-    if client is not None:
-        mg_utils.stop_dask_client(client, cluster)
 
 
 @pytest.fixture(scope="module")
@@ -229,6 +346,9 @@ def directed_graph(request, dataset):
     return G
 
 
+# Integer vertex IDs are renumbered by the C++ graph constructor, which also
+# lays out the adjacency (transposed or not) from the renumbered edges, so a
+# transposed graph cannot reuse the renumbering done for the graph fixture.
 @pytest.fixture(scope="module")
 def transposed_graph(request, dataset):
     G = dataset.get_graph(store_transposed=True)
@@ -253,8 +373,7 @@ def get_vertex_pairs(G, num_vertices=10):
     if isinstance(random_vertices, dask_cudf.Series):
         random_vertices = random_vertices.compute()
 
-    vertices = random_vertices.to_arrow().to_pylist()
-    return G.get_two_hop_neighbors(start_vertices=vertices)
+    return G.get_two_hop_neighbors(start_vertices=random_vertices)
 
 
 ###############################################################################
@@ -300,7 +419,13 @@ def bench_pagerank(benchmark, transposed_graph):
 
 def bench_bfs(benchmark, graph):
     bfs = dask_cugraph.bfs if is_graph_distributed(graph) else cugraph.bfs
-    start = graph.edgelist.edgelist_df["src"][0]
+    srcs = graph.edgelist.edgelist_df["src"]
+    if is_graph_distributed(graph):
+        # Search all partitions in case the first one is empty.
+        start_col = srcs.head(1, npartitions=-1)
+    else:
+        start_col = srcs.head(1)
+    start = int(start_col.iloc[0])
     benchmark(bfs, graph, start)
 
 
@@ -422,10 +547,10 @@ def bench_uniform_neighbor_sample(benchmark, graph):
     # FIXME: may need to provide number_of_vertices separately
     num_verts_in_graph = graph.number_of_vertices()
     len_start_list = max(int(num_verts_in_graph * 0.01), 2)
-    srcs = graph.edgelist.edgelist_df["src"]
-    frac = len_start_list / num_verts_in_graph
 
-    start_list = srcs.sample(frac=frac, random_state=seed)
+    start_list = graph.select_random_vertices(
+        random_state=seed, num_vertices=len_start_list
+    )
     # Attempt to automatically handle a dask Series
     if hasattr(start_list, "compute"):
         start_list = start_list.compute()
@@ -441,3 +566,15 @@ def bench_egonet(benchmark, graph):
     n = 1
     radius = 2
     benchmark(egonet, graph, n, radius=radius)
+
+
+def bench_egonet_batched(benchmark, graph):
+    # A single seed mostly measures launch overhead on larger graphs. Only the
+    # distributed ego_graph supports extracting egonets for a batch of seeds.
+    if not is_graph_distributed(graph):
+        pytest.skip("SG ego_graph only supports a single seed")
+    n = graph.select_random_vertices(
+        random_state=42, num_vertices=min(32, graph.number_of_vertices())
+    )
+    radius = 2
+    benchmark(dask_cugraph.ego_graph, graph, n, radius=radius)
@@ -1,4 +1,4 @@
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2026, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -11,6 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 import pytest
 
 
@@ -46,6 +48,15 @@ def pytest_addoption(parser):
         "This results in a graph with (2^scale)*edgefactor edges. Default "
         "is %(default)s.",
     )
+    parser.addoption(
+        "--rmat-cache-dir",
+        action="store",
+        default=os.path.expanduser("~/.cache/cugraph_bench"),
+        metavar="dir",
+        help="Directory used to cache RMAT edgelists as Parquet files so they "
+        "are only generated once across pytest sessions. Pass an empty "
+        "string to disable caching. Default is %(default)s.",
+    )
 
 
 def pytest_sessionstart(session):
@@ -81,3 +92,4 @@ def pytest_sessionstart(session):
     # FIXME: is there a better way to do this?
     pytest._rmat_scale = session.config.getoption("rmat_scale")
     pytest._rmat_edgefactor = session.config.getoption("rmat_edgefactor")
+    pytest._rmat_cache_dir = session.config.getoption("rmat_cache_dir")
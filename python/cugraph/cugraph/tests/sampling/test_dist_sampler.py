@@ -1,4 +1,4 @@
-# Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -12,8 +12,7 @@
 # limitations under the License.
 
 import pytest
-import os
-import shutil
+import pathlib
 
 import cupy
 import cudf
@@ -25,7 +24,6 @@ from cugraph.gnn.data_loading.bulk_sampler_io import create_df_from_disjoint_arr
 from pylibcugraph import SGGraph, ResourceHandle, GraphProperties
 
 from cugraph.utilities.utils import (
-    create_directory_with_overwrite,
     import_optional,
     MissingModule,
 )
@@ -41,15 +39,25 @@ if not isinstance(torch, MissingModule):
         pytest.skip("CUDA-enabled PyTorch is unavailable", allow_module_level=True)
 
 
-@pytest.fixture
-def karate_graph() -> SGGraph:
+@pytest.fixture(scope="module")
+def karate_arrays():
     el = karate.get_edgelist().reset_index().rename(columns={"index": "eid"})
+    return (
+        cupy.asarray(el.src, dtype="int64"),
+        cupy.asarray(el.dst, dtype="int64"),
+        cupy.asarray(el.eid, dtype="int64"),
+    )
+
+
+@pytest.fixture
+def karate_graph(karate_arrays) -> SGGraph:
+    src, dst, eid = karate_arrays
     G = SGGraph(
         ResourceHandle(),
         GraphProperties(is_multigraph=True, is_symmetric=False),
-        el.src.astype("int64"),
-        el.dst.astype("int64"),
-        edge_id_array=el.eid,
+        src,
+        dst,
+        edge_id_array=eid,
     )
 
     return G
@@ -61,12 +69,11 @@ def karate_graph() -> SGGraph:
 @pytest.mark.parametrize("batch_size", [1, 2, 4])
 @pytest.mark.skipif(isinstance(torch, MissingModule), reason="torch not available")
 def test_dist_sampler_simple(
-    scratch_dir, karate_graph, batch_size, fanout, equal_input_size
+    tmp_path, karate_graph, batch_size, fanout, equal_input_size
 ):
     G = karate_graph
 
-    samples_path = os.path.join(scratch_dir, "test_bulk_sampler_simple")
-    create_directory_with_overwrite(samples_path)
+    samples_path = str(tmp_path)
 
     writer = DistSampleWriter(samples_path)
 
@@ -81,26 +88,27 @@ def test_dist_sampler_simple(
     recovered_samples = cudf.read_parquet(samples_path)
     original_el = karate.get_edgelist()
 
-    for b in range(len(seeds) // batch_size):
-        el_start = recovered_samples.label_hop_offsets.iloc[b * len(fanout)]
-        el_end = recovered_samples.label_hop_offsets.iloc[(b + 1) * len(fanout)]
-
-        src = recovered_samples.majors.iloc[el_start:el_end]
-        dst = recovered_samples.minors.iloc[el_start:el_end]
-        edge_id = recovered_samples.edge_id.iloc[el_start:el_end]
+    num_batches = len(seeds) // batch_size
 
-        map_start = recovered_samples.renumber_map_offsets[b]
-        map_end = recovered_samples.renumber_map_offsets[b + 1]
-        renumber_map = recovered_samples["map"].iloc[map_start:map_end]
+    # Columns are padded with nulls at the end, so dropping them does not
+    # shift the positions of the valid entries.
+    label_hop_offsets = recovered_samples.label_hop_offsets.dropna().values
+    renumber_map_offsets = recovered_samples.renumber_map_offsets.dropna().values
+    renumber_map = recovered_samples["map"].dropna().values
 
-        src = renumber_map.iloc[src.values]
-        dst = renumber_map.iloc[dst.values]
+    # Assign each sampled edge to its batch so every edge can be mapped back
+    # through its batch's renumber map in a single gather.
+    batch_offsets = label_hop_offsets[: num_batches * len(fanout) + 1 : len(fanout)]
+    edge_range = cupy.arange(int(batch_offsets[0]), int(batch_offsets[-1]))
+    edge_batch = cupy.searchsorted(batch_offsets, edge_range, side="right") - 1
+    map_start = renumber_map_offsets[edge_batch]
 
-        for i in range(len(edge_id)):
-            assert original_el.src.iloc[edge_id.iloc[i]] == src.iloc[i]
-            assert original_el.dst.iloc[edge_id.iloc[i]] == dst.iloc[i]
+    src = renumber_map[map_start + recovered_samples.majors.dropna().values[edge_range]]
+    dst = renumber_map[map_start + recovered_samples.minors.dropna().values[edge_range]]
+    edge_id = recovered_samples.edge_id.dropna().values[edge_range]
 
-    shutil.rmtree(samples_path)
+    assert (original_el.src.values[edge_id] == src).all()
+    assert (original_el.dst.values[edge_id] == dst).all()
 
 
 @pytest.mark.sg
@@ -108,12 +116,11 @@ def test_dist_sampler_simple(
 @pytest.mark.parametrize("seeds_per_call", [4, 5, 10])
 @pytest.mark.parametrize("compression", ["CSR", "COO"])
 def test_dist_sampler_buffered_in_memory(
-    scratch_dir: str, karate_graph: SGGraph, seeds_per_call: int, compression: str
+    tmp_path: pathlib.Path, karate_graph: SGGraph, seeds_per_call: int, compression: str
 ):
     G = karate_graph
 
-    samples_path = os.path.join(scratch_dir, "test_bulk_sampler_buffered_in_memory")
-    create_directory_with_overwrite(samples_path)
+    samples_path = str(tmp_path)
 
     seeds = cupy.arange(10, dtype="int64")
 
@@ -153,10 +160,10 @@ def test_dist_sampler_buffered_in_memory(
 
         assert (be - bs) == (ue - us)
 
-        for col in ur.columns:
-            assert (br[col].dropna() == ur[col].dropna()).all()
-
-    shutil.rmtree(samples_path)
+        # The buffered results carry extra entries (e.g. "fanout") that are
+        # never written to disk, so only compare the columns that were.
+        # Null padding compares as null, which all() skips.
+        assert (br[ur.columns] == ur).all().all()
 
 
 @pytest.mark.sg
@@ -1,4 +1,4 @@
-# Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
@@ -97,15 +97,9 @@ def run_test_dist_sampler_simple(
 
     seeds = cupy.random.randint(0, 34, seeds_per_rank, dtype="int64")
 
-    from time import perf_counter
-
-    start_time = perf_counter()
     sampler.sample_from_nodes(
         seeds, batch_size=batch_size, assume_equal_input_size=equal_input_size
     )
-    end_time = perf_counter()
-
-    print("time:", end_time - start_time)
 
     cugraph_comms_shutdown()
 
@@ -185,15 +179,9 @@ def run_test_dist_sampler_uneven(
     num_seeds = 8 + rank
     seeds = cupy.random.randint(0, 34, num_seeds, dtype="int64")
 
-    from time import perf_counter
-
-    start_time = perf_counter()
     sampler.sample_from_nodes(
         seeds, batch_size=batch_size, assume_equal_input_size=False
     )
-    end_time = perf_counter()
-
-    print("time:", end_time - start_time)
 
     cugraph_comms_shutdown()
 